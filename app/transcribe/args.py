@@ -2,15 +2,70 @@ import sys
 import os
 import argparse
 from argparse import RawTextHelpFormatter
-import yaml
-from global_vars import TranscriptionGlobals
-import interactions  # noqa: E402 pylint: disable=C0413
-from tsutils import utilities, duration, configuration  # noqa: E402 pylint: disable=C0413
-from sdk import audio_recorder as ar  # noqa: E402 pylint: disable=C0413
+from typing import TYPE_CHECKING
+
+# Heavy modules (audio backends, yaml, sdk) are imported inside the functions that
+# need them, so this module can be imported without them.
+if TYPE_CHECKING:
+    from global_vars import TranscriptionGlobals
+
+# Mapping of command line arguments to config values.
+# (argument name, ((section, key), ...), conversion, value when argument is not specified)
+_ARG_CONFIG_MAP = (
+    ('api_key', (('OpenAI', 'api_key'),), None, None),
+    ('model', (('OpenAI', 'local_transcripton_model_file'),
+               ('WhisperCpp', 'local_transcripton_model_file')), None, 'base'),
+    ('api', (('General', 'use_api'),), None, None),
+    ('disable_mic', (('General', 'disable_mic'),), None, None),
+    ('mic_device_index', (('General', 'mic_device_index'),), int, None),
+    ('disable_speaker', (('General', 'disable_speaker'),), None, None),
+    ('speaker_device_index', (('General', 'speaker_device_index'),), int, None),
+)
+
+# Valid values for command line arguments with a fixed set of choices
+_STT_CHOICES = ('whisper', 'whisper.cpp', 'deepgram')
+_CHAT_CHOICES = ('openai', 'together')
+_MODEL_CHOICES = ('tiny', 'base', 'small', 'medium', 'large-v1', 'large-v2', 'large-v3', 'large')
+
+# Values of all command line arguments when none are specified.
+# Must be kept in sync with the defaults in _build_parser.
+_DEFAULT_ARGS = {
+    'api': False,
+    'experimental': False,
+    'speech_to_text': 'whisper',
+    'chat_inference_provider': 'openai',
+    'api_key': None,
+    'save_api_key': None,
+    'transcribe': None,
+    'output_file': None,
+    'model': 'base',
+    'list_devices': False,
+    'mic_device_index': None,
+    'speaker_device_index': None,
+    'disable_mic': False,
+    'disable_speaker': False,
+}
 
 
 def create_args() -> argparse.Namespace:
     """Set up Command line arguments for application"""
+    # The common case of launching the UI without arguments does not need the parser
+    if len(sys.argv) <= 1:
+        return argparse.Namespace(**_DEFAULT_ARGS)
+
+    # Listing devices on its own does not need the parser.
+    # Combined with other arguments it is left to argparse to validate.
+    if sys.argv[1:] in (['-l'], ['--list_devices']):
+        list_devices()
+        sys.exit(0)
+
+    cmd_args = _build_parser()
+    args = cmd_args.parse_args()
+    return args
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the parser for all command line arguments"""
     cmd_args = argparse.ArgumentParser(description='Command Line Arguments for Transcribe',
                                        formatter_class=RawTextHelpFormatter)
     cmd_args.add_argument('-a', '--api', action='store_true',
@@ -19,12 +74,12 @@ def create_args() -> argparse.Namespace:
     cmd_args.add_argument('-e', '--experimental', action='store_true',
                           help='Experimental command line argument. Behavior is undefined.')
     cmd_args.add_argument('-stt', '--speech_to_text', action='store', default='whisper',
-                          choices=['whisper', 'whisper.cpp', 'deepgram'],
+                          choices=_STT_CHOICES,
                           help='Specify the Speech to text Engine.'
                           '\nLocal STT models tend to perform best for response times.'
                           '\nAPI based STT models tend to perform best for accuracy.')
     cmd_args.add_argument('-c', '--chat-inference-provider', action='store', default='openai',
-                          choices=['openai', 'together'],
+                          choices=_CHAT_CHOICES,
                           help='Specify the Chat Inference engine.')
     cmd_args.add_argument('-k', '--api_key', action='store', default=None,
                           help='API Key for accessing OpenAI APIs. This is an optional parameter.\
@@ -42,11 +97,10 @@ def create_args() -> argparse.Namespace:
     cmd_args.add_argument('-o', '--output_file', action='store', default=None,
                           help='Generate output in this file.\
                             \nThis option is valid only for the -t (transcribe) option.')
-    cmd_args.add_argument('-m', '--model', action='store', choices=[
-        'tiny', 'base', 'small', 'medium', 'large-v1', 'large-v2', 'large-v3', 'large'],
-        default='base',
-        help='Specify the OpenAI Local Transcription model file to use.'
-        '\nThe necessary model files will be downloaded once at run time.')  # noqa: E501  pylint: disable=C0115
+    cmd_args.add_argument('-m', '--model', action='store', choices=_MODEL_CHOICES,
+                          default='base',
+                          help='Specify the OpenAI Local Transcription model file to use.'
+                          '\nThe necessary model files will be downloaded once at run time.')  # noqa: E501  pylint: disable=C0115
     cmd_args.add_argument('-l', '--list_devices', action='store_true',
                           help='List all audio drivers and audio devices on this machine.'
                           '\nUse this list index to select the microphone, speaker device for transcription.')
@@ -60,17 +114,26 @@ def create_args() -> argparse.Namespace:
                           help='Disable transcription from Microphone')
     cmd_args.add_argument('-ds', '--disable_speaker', action='store_true',
                           help='Disable transcription from Speaker')
-    args = cmd_args.parse_args()
-    return args
+    return cmd_args
+
+
+def list_devices():
+    """Print all audio drivers and devices on this machine"""
+    from sdk import audio_recorder as ar  # pylint: disable=C0415
+
+    print('\n\nList all audio drivers and devices on this machine')
+    ar.print_detailed_audio_info()
 
 
-def handle_args_batch_tasks(args: argparse.Namespace, global_vars: TranscriptionGlobals):
+def handle_args_batch_tasks(args: argparse.Namespace, global_vars: 'TranscriptionGlobals'):
     """Handle batch tasks, after which the program will exit."""
+    import interactions  # pylint: disable=C0415
+    from tsutils import utilities, duration  # pylint: disable=C0415
+
     interactions.params(args)
 
     if args.list_devices:
-        print('\n\nList all audio drivers and devices on this machine')
-        ar.print_detailed_audio_info()
+        list_devices()
         sys.exit(0)
 
     if args.save_api_key is not None:
@@ -81,8 +144,9 @@ def handle_args_batch_tasks(args: argparse.Namespace, global_vars: Transcription
         with duration.Duration(name='Transcription', log=False, screen=True):
             output_file = args.output_file if args.output_file is not None else "transcription.txt"
             print(f'Converting the audio file {args.transcribe} to text.')
+            file_stat = os.stat(args.transcribe)
             print(f'{args.transcribe} file size '
-                  f'{utilities.naturalsize(os.path.getsize(args.transcribe))}.')
+                  f'{utilities.naturalsize(file_stat.st_size)}.')
             print(f'Text output will be produced in {output_file}.')
             # For whisper.cpp STT convert the file to 16 khz
             file_path = args.transcribe
@@ -94,7 +158,8 @@ def handle_args_batch_tasks(args: argparse.Namespace, global_vars: Transcription
             text = global_vars.transcriber.stt_model.process_response(results)
             if results is not None and len(text) > 0:
                 with open(output_file, encoding='utf-8', mode='w') as f:
-                    f.write(f"{text}\n")
+                    f.write(text)
+                    f.write('\n')
                 print('Complete!')
             else:
                 print('Error during Transcription!')
@@ -106,60 +171,23 @@ def handle_args_batch_tasks(args: argparse.Namespace, global_vars: Transcription
 def update_args_config(args: argparse.Namespace, config: dict):
     # Command line arg for api_key takes preference over api_key specified in yaml file
     # TODO: We should be able to set deepgram API key from command line as well
-    if args.api_key is not None:
-        config['OpenAI']['api_key'] = args.api_key
-
-    if args.model is not None:
-        config['OpenAI']['local_transcripton_model_file'] = args.model
-        config['WhisperCpp']['local_transcripton_model_file'] = args.model
-    else:
-        config['OpenAI']['local_transcripton_model_file'] = 'base'
-        config['WhisperCpp']['local_transcripton_model_file'] = 'base'
-
-    if args.api:
-        config['General']['use_api'] = args.api
-
-    if args.disable_mic:
-        config['General']['disable_mic'] = args.disable_mic
-
-    if args.mic_device_index is not None:
-        config['General']['mic_device_index'] = int(args.mic_device_index)
-
-    if args.disable_speaker:
-        config['General']['disable_speaker'] = args.disable_speaker
-
-    if args.speaker_device_index is not None:
-        config['General']['speaker_device_index'] = int(args.speaker_device_index)
-
-
-def update_audio_devices(global_vars: TranscriptionGlobals, config: dict):
-    """Handle all application configuration using the command line args"""
-
-    # Handle mic if it is not disabled in arguments or yaml file
-    if not config['General']['disable_mic']:
-        if config['General']['mic_device_index'] != -1:
-            print('[INFO] Override default microphone with device specified in parameters file.')
-            global_vars.user_audio_recorder.set_device(index=int(config['General']['mic_device_index']))
-
-    # Handle speaker if it is not disabled in arguments or yaml file
-    if not config['General']['disable_speaker']:
-        if config['General']['speaker_device_index'] != -1:
-            print('[INFO] Override default speaker with device specified in parameters file.')
-            global_vars.user_audio_recorder.set_device(index=int(config['General']['speaker_device_index']))
+    arg_values = vars(args)
+    for attr, targets, conv, default in _ARG_CONFIG_MAP:
+        value = arg_values.get(attr)
+        # Flags that were not specified are None or False
+        if value is None or value is False:
+            value = default
+            if value is None:
+                continue
+        if conv is not None:
+            value = conv(value)
+        for section, key in targets:
+            config[section][key] = value
 
 
 def save_api_key(args: argparse.Namespace):
     """Save the API key specified on command line to override parameters file"""
+    from tsutils import configuration  # pylint: disable=C0415
 
-    yml = configuration.Config()
-    with open(yml.config_override_file, mode='r', encoding='utf-8') as file:
-        try:
-            altered_config = yaml.load(stream=file, Loader=yaml.SafeLoader)
-        except ImportError as err:
-            print(f'Failed to load yaml file: {yml.config_override_file}.')
-            print(f'Error: {err}')
-            sys.exit(1)
-
-    altered_config['OpenAI']['api_key'] = args.save_api_key
-    yml.add_override_value(altered_config)
-    print(f'Saved API Key to {yml.config_override_file}')
+    configuration.Config.load_alter_save('OpenAI', 'api_key', args.save_api_key)
+    print(f'Saved API Key to {configuration.Config().config_override_file}')
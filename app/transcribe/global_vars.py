@@ -65,19 +65,24 @@ class TranscriptionGlobals(Singleton.Singleton):
         self._initialized = True
 
     def initiate_audio_devices(self, config: dict):
-        # Handle mic if it is not disabled in arguments or yaml file
         print('[INFO] Using default microphone.')
         self.user_audio_recorder = ar.MicRecorder()
-        if not config['General']['disable_mic'] and config['General']['mic_device_index'] != -1:
-            print('[INFO] Override default microphone with device specified in parameters file.')
-            self.user_audio_recorder.set_device(index=int(config['General']['mic_device_index']))
-
-        # Handle speaker if it is not disabled in arguments or yaml file
         print('[INFO] Using default speaker.')
         self.speaker_audio_recorder = ar.SpeakerRecorder()
-        if not config['General']['disable_speaker'] and config['General']['speaker_device_index'] != -1:
-            print('[INFO] Override default speaker with device specified in parameters file.')
-            self.speaker_audio_recorder.set_device(index=int(config['General']['speaker_device_index']))
+
+        gen = config['General']
+        overrides = (('disable_mic', 'mic_device_index', self.user_audio_recorder, 'microphone'),
+                     ('disable_speaker', 'speaker_device_index', self.speaker_audio_recorder, 'speaker'))
+
+        # Handle mic, speaker if they are not disabled in arguments or yaml file
+        for disable_key, index_key, recorder, device_name in overrides:
+            if gen[disable_key]:
+                continue
+            index = gen[index_key]
+            if index != -1:
+                print(f'[INFO] Override default {device_name} with device specified in parameters file.')
+                # Enumerate devices once for both mic and speaker
+                recorder.set_device(index=index, devices=ar.get_devices())
 
     def set_read_response(self, value: bool):
         self.read_response = value
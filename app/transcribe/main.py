@@ -42,8 +42,6 @@ def main():
     speaker_stop_func = global_vars.speaker_audio_recorder.record_into_queue(global_vars.audio_queue)
     global_vars.speaker_audio_recorder.stop_record_func = speaker_stop_func
 
-#    update_audio_devices(global_vars, config)
-
     # Transcriber needs to be created before handling batch tasks which include batch
     # transcription. This order of initialization results in initialization of Mic, Speaker
     # as well which is not necessary for some batch tasks.
@@ -3,6 +3,7 @@ from datetime import datetime
 import time
 from abc import abstractmethod
 import queue
+from typing import Optional
 import pyaudiowpatch as pyaudio
 import custom_speech_recognition as sr
 from tsutils import app_logging as al
@@ -14,6 +15,9 @@ DYNAMIC_ENERGY_THRESHOLD = False
 
 root_logger = al.get_logger()
 
+# Device information of all audio devices, populated on first use by get_devices
+_device_list_cache: Optional[list] = None
+
 
 # https://people.csail.mit.edu/hubert/pyaudio/docs/#id6
 driver_type = {
@@ -86,6 +90,42 @@ def print_detailed_audio_info(print_func=print):
     #    print(device_info_gen)
 
 
+def get_devices() -> list:
+    """Get device information of all audio devices on this machine.
+    Enumerating devices is expensive, the list is enumerated once and reused
+    until invalidate_devices is called.
+    """
+    global _device_list_cache  # pylint: disable=W0603
+    if _device_list_cache is None:
+        with pyaudio.PyAudio() as py_audio:
+            _device_list_cache = list(py_audio.get_device_info_generator())
+    return _device_list_cache
+
+
+def invalidate_devices():
+    """Discard the cached device list, e.g. after audio devices are added or removed.
+    """
+    global _device_list_cache  # pylint: disable=W0603
+    _device_list_cache = None
+
+
+def _device_by_index(devices: list, index: int) -> tuple:
+    """Find device information for the given index in a list of devices.
+    If the cached device list does not have the device, devices are enumerated
+    again in case the device was added after the list was cached.
+    Returns the device information and the device list it was found in.
+    """
+    device = next((device for device in devices if device['index'] == index), None)
+    if device is None and devices is _device_list_cache:
+        invalidate_devices()
+        devices = get_devices()
+        device = next((device for device in devices if device['index'] == index), None)
+    if device is None:
+        # Same error as PyAudio.get_device_info_by_index
+        raise OSError(f'Invalid device index {index}')
+    return device, devices
+
+
 class BaseRecorder:
     """Base class for Speaker, Microphone classes
     """
@@ -174,13 +214,17 @@ class MicRecorder(BaseRecorder):
     def get_name(self):
         return f'#{self.device_index} - {self.device_info["name"]}'
 
-    def set_device(self, index: int):
+    def set_device(self, index: int, devices: Optional[list] = None):
         """Set active device based on index.
+        devices is the list from get_devices, when specified devices are not enumerated again.
         """
         root_logger.info(MicRecorder.set_device.__name__)
-        with pyaudio.PyAudio() as py_audio:
-            self.device_index = index
-            mic = py_audio.get_device_info_by_index(self.device_index)
+        self.device_index = index
+        if devices is not None:
+            mic, _ = _device_by_index(devices, self.device_index)
+        else:
+            with pyaudio.PyAudio() as py_audio:
+                mic = py_audio.get_device_info_by_index(self.device_index)
 
         # Stop the current stream
         if self.stop_record_func is not None:
@@ -232,21 +276,27 @@ class SpeakerRecorder(BaseRecorder):
     def get_name(self):
         return f'#{self.device_index} - {self.device_info["name"]}'
 
-    def set_device(self, index: int):
+    def set_device(self, index: int, devices: Optional[list] = None):
         """Set active device based on index.
+        devices is the list from get_devices, when specified devices are not enumerated again.
         """
         root_logger.info(SpeakerRecorder.set_device.__name__)
-        with pyaudio.PyAudio() as p:
-            self.device_index = index
-            speakers = p.get_device_info_by_index(self.device_index)
-
-            if not speakers["isLoopbackDevice"]:
-                for loopback in p.get_loopback_device_info_generator():
-                    if speakers["name"] in loopback["name"]:
-                        speakers = loopback
-                        break
-                else:
-                    print("[ERROR] No loopback device found.")
+        self.device_index = index
+        if devices is not None:
+            speakers, devices = _device_by_index(devices, self.device_index)
+            loopbacks = [device for device in devices if device["isLoopbackDevice"]]
+        else:
+            with pyaudio.PyAudio() as p:
+                speakers = p.get_device_info_by_index(self.device_index)
+                loopbacks = list(p.get_loopback_device_info_generator())
+
+        if not speakers["isLoopbackDevice"]:
+            for loopback in loopbacks:
+                if speakers["name"] in loopback["name"]:
+                    speakers = loopback
+                    break
+            else:
+                print("[ERROR] No loopback device found.")
 
         # Stop the current stream
         if self.stop_record_func is not None:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import copy
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'app', 'transcribe'))
+import args  # noqa: E402 pylint: disable=C0413
+
+
+class TestCreateArgs(unittest.TestCase):
+    def test_default_args_match_parser(self):
+        self.assertEqual(vars(args._build_parser().parse_args([])), args._DEFAULT_ARGS)
+
+    def test_no_args_returns_defaults(self):
+        saved_argv = sys.argv
+        sys.argv = ['main.py']
+        try:
+            self.assertEqual(vars(args.create_args()), args._DEFAULT_ARGS)
+        finally:
+            sys.argv = saved_argv
+
+    def create_args(self, argv):
+        with mock.patch.object(sys, 'argv', ['main.py'] + argv), \
+             mock.patch.object(args, 'list_devices') as list_devices, \
+             mock.patch('sys.stdout'), mock.patch('sys.stderr'):
+            with self.assertRaises(SystemExit) as context:
+                args.create_args()
+        return context.exception.code, list_devices.called
+
+    def test_list_devices_alone(self):
+        self.assertEqual(self.create_args(['-l']), (0, True))
+        self.assertEqual(self.create_args(['--list_devices']), (0, True))
+
+    def test_list_devices_with_other_args_uses_parser(self):
+        self.assertEqual(self.create_args(['-l', '--bogus']), (2, False))
+        self.assertEqual(self.create_args(['-h', '-l']), (0, False))
+
+
+def update_args_config_branches(cmd_args, config: dict):
+    """update_args_config as it was written before being table driven"""
+    if cmd_args.api_key is not None:
+        config['OpenAI']['api_key'] = cmd_args.api_key
+    if cmd_args.model is not None:
+        config['OpenAI']['local_transcripton_model_file'] = cmd_args.model
+        config['WhisperCpp']['local_transcripton_model_file'] = cmd_args.model
+    else:
+        config['OpenAI']['local_transcripton_model_file'] = 'base'
+        config['WhisperCpp']['local_transcripton_model_file'] = 'base'
+    if cmd_args.api:
+        config['General']['use_api'] = cmd_args.api
+    if cmd_args.disable_mic:
+        config['General']['disable_mic'] = cmd_args.disable_mic
+    if cmd_args.mic_device_index is not None:
+        config['General']['mic_device_index'] = int(cmd_args.mic_device_index)
+    if cmd_args.disable_speaker:
+        config['General']['disable_speaker'] = cmd_args.disable_speaker
+    if cmd_args.speaker_device_index is not None:
+        config['General']['speaker_device_index'] = int(cmd_args.speaker_device_index)
+
+
+class TestUpdateArgsConfig(unittest.TestCase):
+    CONFIG = {
+        'OpenAI': {'api_key': 'yaml_key', 'local_transcripton_model_file': 'small'},
+        'WhisperCpp': {'local_transcripton_model_file': 'small'},
+        'General': {'use_api': True, 'disable_mic': True, 'disable_speaker': False,
+                    'mic_device_index': 3, 'speaker_device_index': -1}
+    }
+
+    def update(self, argv, cmd_args=None):
+        if cmd_args is None:
+            cmd_args = args._build_parser().parse_args(argv)
+        config = copy.deepcopy(self.CONFIG)
+        args.update_args_config(cmd_args, config)
+        expected = copy.deepcopy(self.CONFIG)
+        update_args_config_branches(cmd_args, expected)
+        self.assertEqual(config, expected)
+        return config
+
+    def test_no_args(self):
+        config = self.update([])
+        # Unset store_true flags leave the yaml values unchanged
+        self.assertTrue(config['General']['use_api'])
+        self.assertTrue(config['General']['disable_mic'])
+        self.assertEqual(config['General']['mic_device_index'], 3)
+        self.assertEqual(config['OpenAI']['api_key'], 'yaml_key')
+        self.assertEqual(config['WhisperCpp']['local_transcripton_model_file'], 'base')
+
+    def test_all_args(self):
+        config = self.update(['-a', '-k', 'cmd_key', '-m', 'tiny', '-dm', '-ds', '-mi', '1', '-si', '2'])
+        self.assertEqual(config['OpenAI']['api_key'], 'cmd_key')
+        self.assertEqual(config['OpenAI']['local_transcripton_model_file'], 'tiny')
+        self.assertEqual(config['WhisperCpp']['local_transcripton_model_file'], 'tiny')
+        self.assertTrue(config['General']['disable_speaker'])
+        self.assertEqual(config['General']['speaker_device_index'], 2)
+
+    def test_device_index_zero(self):
+        config = self.update(['-mi', '0', '-si', '0'])
+        self.assertEqual(config['General']['mic_device_index'], 0)
+        self.assertEqual(config['General']['speaker_device_index'], 0)
+
+    def test_model_not_specified(self):
+        cmd_args = args._build_parser().parse_args([])
+        cmd_args.model = None
+        config = self.update(None, cmd_args)
+        self.assertEqual(config['OpenAI']['local_transcripton_model_file'], 'base')
+
+
+if __name__ == '__main__':
+    unittest.main()
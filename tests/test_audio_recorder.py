@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# tsutils.app_logging imports modules from the application directory
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'app', 'transcribe'))
+from sdk import audio_recorder as ar  # noqa: E402 pylint: disable=C0413
+
+DEVICES = [
+    {'index': 0, 'name': 'Speakers (Realtek Audio)', 'isLoopbackDevice': False,
+     'defaultSampleRate': 48000.0, 'maxInputChannels': 0},
+    {'index': 1, 'name': 'Microphone (Realtek Audio)', 'isLoopbackDevice': False,
+     'defaultSampleRate': 44100.0, 'maxInputChannels': 2},
+    {'index': 2, 'name': 'Headphones (USB Audio) [Loopback]', 'isLoopbackDevice': True,
+     'defaultSampleRate': 44100.0, 'maxInputChannels': 2},
+    {'index': 3, 'name': 'Speakers (Realtek Audio) [Loopback]', 'isLoopbackDevice': True,
+     'defaultSampleRate': 48000.0, 'maxInputChannels': 2},
+]
+
+
+class TestSetDevice(unittest.TestCase):
+    def setUp(self):
+        ar.invalidate_devices()
+        patchers = [mock.patch.object(ar.sr, 'Microphone'),
+                    mock.patch.object(ar.pyaudio, 'PyAudio'),
+                    mock.patch('builtins.print')]
+        self.microphone, self.py_audio, _ = [patcher.start() for patcher in patchers]
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+        self.addCleanup(ar.invalidate_devices)
+
+    def recorder(self, recorder_class):
+        # Skip __init__, it opens the default device
+        recorder = recorder_class.__new__(recorder_class)
+        recorder.stop_record_func = None
+        recorder.adjust_for_noise = mock.Mock()
+        return recorder
+
+    def test_speaker_uses_loopback_device(self):
+        speaker = self.recorder(ar.SpeakerRecorder)
+        speaker.set_device(index=0, devices=DEVICES)
+        self.assertEqual(speaker.device_info, DEVICES[3])
+        self.assertEqual(self.microphone.call_args.kwargs['device_index'], 3)
+        self.py_audio.assert_not_called()
+
+    def test_speaker_loopback_device(self):
+        speaker = self.recorder(ar.SpeakerRecorder)
+        speaker.set_device(index=2, devices=DEVICES)
+        self.assertEqual(speaker.device_info, DEVICES[2])
+
+    def test_mic(self):
+        mic = self.recorder(ar.MicRecorder)
+        mic.set_device(index=1, devices=DEVICES)
+        self.assertEqual(mic.device_info, DEVICES[1])
+        self.assertEqual(self.microphone.call_args.kwargs['device_index'], 1)
+        self.py_audio.assert_not_called()
+
+    def test_invalid_index(self):
+        mic = self.recorder(ar.MicRecorder)
+        with self.assertRaises(OSError):
+            mic.set_device(index=9, devices=DEVICES)
+
+    def test_devices_enumerated_once(self):
+        self.py_audio.return_value.__enter__.return_value.get_device_info_generator.return_value = iter(DEVICES)
+        self.assertIs(ar.get_devices(), ar.get_devices())
+        self.assertEqual(self.py_audio.call_count, 1)
+
+    def test_cached_devices_refreshed_for_new_device(self):
+        py_audio = self.py_audio.return_value.__enter__.return_value
+        py_audio.get_device_info_generator.side_effect = [iter(DEVICES[:2]), iter(DEVICES)]
+        speaker = self.recorder(ar.SpeakerRecorder)
+        speaker.set_device(index=3, devices=ar.get_devices())
+        self.assertEqual(speaker.device_info, DEVICES[3])
+        self.assertEqual(ar.get_devices(), DEVICES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import datetime
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import yaml
+
+from tsutils import configuration
+
+
+class TestLoadYamlFile(unittest.TestCase):
+    def setUp(self):
+        configuration._yaml_cache.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = self.write_yaml('config.yaml', 'General:\n  value: 1\n')
+
+    def tearDown(self):
+        configuration._yaml_cache.clear()
+        self.temp_dir.cleanup()
+
+    def write_yaml(self, name, content, mtime=None):
+        filename = os.path.join(self.temp_dir.name, name)
+        with open(filename, mode='w', encoding='utf-8') as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(filename, (mtime, mtime))
+        return filename
+
+    def test_cache_hit(self):
+        with mock.patch.object(yaml, 'load', wraps=yaml.load) as load:
+            self.assertEqual(configuration.load_yaml_file(self.filename), {'General': {'value': 1}})
+            self.assertEqual(configuration.load_yaml_file(self.filename), {'General': {'value': 1}})
+        self.assertEqual(load.call_count, 1)
+
+    def test_returned_data_does_not_alter_cache(self):
+        data = configuration.load_yaml_file(self.filename)
+        data['General']['value'] = 2
+        self.assertEqual(configuration.load_yaml_file(self.filename), {'General': {'value': 1}})
+
+    def test_cache_miss_on_size_change(self):
+        configuration.load_yaml_file(self.filename)
+        self.write_yaml('config.yaml', 'General:\n  value: 10\n')
+        self.assertEqual(configuration.load_yaml_file(self.filename), {'General': {'value': 10}})
+
+    def test_cache_miss_on_mtime_change(self):
+        self.write_yaml('config.yaml', 'General:\n  value: 1\n', mtime=1000000)
+        configuration.load_yaml_file(self.filename)
+        # Same size, different content and modification time
+        self.write_yaml('config.yaml', 'General:\n  value: 2\n', mtime=2000000)
+        self.assertEqual(configuration.load_yaml_file(self.filename), {'General': {'value': 2}})
+
+    def test_lru_eviction(self):
+        second = self.write_yaml('second.yaml', 'a: 2\n')
+        third = self.write_yaml('third.yaml', 'a: 3\n')
+        with mock.patch.object(configuration, 'YAML_CACHE_MAX_ENTRIES', 2):
+            configuration.load_yaml_file(self.filename)
+            configuration.load_yaml_file(second)
+            # Use the first file so the second one is the least recently used
+            configuration.load_yaml_file(self.filename)
+            configuration.load_yaml_file(third)
+        self.assertEqual(list(configuration._yaml_cache), [self.filename, third])
+
+
+class TestJsonSidecar(unittest.TestCase):
+    def setUp(self):
+        configuration._yaml_cache.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, 'override.yaml')
+        self.json_filename = os.path.join(self.temp_dir.name, 'override.json')
+        self.write_yaml('OpenAI:\n  api_key: yaml\n')
+
+    def tearDown(self):
+        configuration._yaml_cache.clear()
+        self.temp_dir.cleanup()
+
+    def write_yaml(self, content, mtime=None):
+        with open(self.filename, mode='w', encoding='utf-8') as f:
+            f.write(content)
+        if mtime is not None:
+            os.utime(self.filename, (mtime, mtime))
+
+    def test_sidecar_preferred_when_current(self):
+        configuration._write_json_sidecar(self.filename, {'OpenAI': {'api_key': 'json'}})
+        with mock.patch.object(yaml, 'load', wraps=yaml.load) as load:
+            data = configuration._load_override_file(self.filename)
+        self.assertEqual(data, {'OpenAI': {'api_key': 'json'}})
+        load.assert_not_called()
+
+    def test_sidecar_ignored_when_stale(self):
+        self.write_yaml('OpenAI:\n  api_key: yaml\n', mtime=1000000)
+        configuration._write_json_sidecar(self.filename, {'OpenAI': {'api_key': 'json'}})
+        # Same size, edited after the sidecar was written
+        self.write_yaml('OpenAI:\n  api_key: edit\n', mtime=2000000)
+        self.assertEqual(configuration._load_override_file(self.filename), {'OpenAI': {'api_key': 'edit'}})
+
+    def test_corrupt_sidecar_falls_back_to_yaml(self):
+        with open(self.json_filename, mode='w', encoding='utf-8') as f:
+            f.write('{"yaml_mtime_ns": 1')
+        self.assertEqual(configuration._load_override_file(self.filename), {'OpenAI': {'api_key': 'yaml'}})
+
+    def test_sidecar_not_written_for_non_json_data(self):
+        configuration._write_json_sidecar(self.filename, {'OpenAI': {'api_key': 'json'}})
+        self.assertTrue(os.path.exists(self.json_filename))
+        configuration._write_json_sidecar(self.filename, {'General': {'since': datetime.date(2024, 1, 1)}})
+        self.assertFalse(os.path.exists(self.json_filename))
+        configuration._write_json_sidecar(self.filename, {'General': {1: 'one'}})
+        self.assertFalse(os.path.exists(self.json_filename))
+
+    def test_add_override_value_with_date(self):
+        self.write_yaml('General:\n  since: 2024-01-01\n')
+        config = object.__new__(configuration.Config)
+        config._override_config_filename = self.filename
+        config._override_data = configuration._load_override_file(self.filename)
+        config._current_data = {}
+        for api_key in ('first', 'second'):
+            config.add_override_value({'OpenAI': {'api_key': api_key}})
+            self.assertEqual(configuration._load_override_file(self.filename),
+                             {'General': {'since': datetime.date(2024, 1, 1)},
+                              'OpenAI': {'api_key': api_key}})
+        self.assertFalse(os.path.exists(self.json_filename))
+
+    def test_add_override_value_writes_sidecar(self):
+        config = object.__new__(configuration.Config)
+        config._override_config_filename = self.filename
+        config._override_data = configuration._load_override_file(self.filename)
+        config._current_data = {}
+        config.add_override_value({'OpenAI': {'api_key': 'saved'}})
+        with mock.patch.object(yaml, 'load', wraps=yaml.load) as load:
+            data = configuration._load_override_file(self.filename)
+        self.assertEqual(data, {'OpenAI': {'api_key': 'saved'}})
+        load.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
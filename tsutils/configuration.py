@@ -1,12 +1,91 @@
+import os
 import sys
+import json
 import time
 import copy
+from collections import OrderedDict
 import yaml
 from tsutils import Singleton
 from tsutils import utilities
 
 
 CONFIG_REFRESH_INTERVAL_SECONDS = 10
+YAML_CACHE_MAX_ENTRIES = 100
+
+# Prefer the libyaml backed loader when it is available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed yaml files keyed by file name, invalidated on change of (mtime, size)
+_yaml_cache: 'OrderedDict[str, tuple[float, int, dict]]' = OrderedDict()
+
+
+def load_yaml_file(filename: str) -> dict:
+    """Load a yaml file, reusing the parsed content if the file has not changed.
+    A copy is returned so callers can alter it without corrupting the cache.
+    """
+    stat = os.stat(filename)
+    cached = _yaml_cache.get(filename)
+    if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        _yaml_cache.move_to_end(filename)
+        return copy.deepcopy(cached[2])
+
+    # Read the whole file at once, the parser handles bytes directly
+    with open(filename, mode='rb') as yaml_file:
+        content = yaml_file.read()
+    data = yaml.load(stream=content, Loader=_YAML_LOADER)
+
+    _yaml_cache[filename] = (stat.st_mtime, stat.st_size, data)
+    _yaml_cache.move_to_end(filename)
+    if len(_yaml_cache) > YAML_CACHE_MAX_ENTRIES:
+        _yaml_cache.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+def _json_sidecar_filename(filename: str) -> str:
+    """Name of the json file holding the same content as the given yaml file"""
+    return os.path.splitext(filename)[0] + '.json'
+
+
+def _load_override_file(filename: str) -> dict:
+    """Load the override yaml file, preferring its json sidecar if it was written
+    for the current contents of the yaml file. json is much faster to parse than yaml.
+    """
+    try:
+        stat = os.stat(filename)
+        with open(_json_sidecar_filename(filename), mode='r', encoding='utf-8') as json_file:
+            sidecar = json.load(json_file)
+        if sidecar['yaml_mtime_ns'] == stat.st_mtime_ns and sidecar['yaml_size'] == stat.st_size:
+            return sidecar['data']
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or corrupt sidecar, use the yaml file
+        pass
+    return load_yaml_file(filename)
+
+
+def _write_json_sidecar(filename: str, data: dict):
+    """Write the json sidecar for the given yaml file, stamped with the
+    modification time and size of the yaml file it was generated from.
+    Data that does not survive a round trip through json, e.g. dates or
+    non string keys, is not written and any existing sidecar is removed.
+    """
+    json_filename = _json_sidecar_filename(filename)
+    try:
+        round_trips = json.loads(json.dumps(data)) == data
+    except (TypeError, ValueError):
+        round_trips = False
+
+    if not round_trips:
+        if os.path.exists(json_filename):
+            os.remove(json_filename)
+        return
+
+    stat = os.stat(filename)
+    content = json.dumps({'yaml_mtime_ns': stat.st_mtime_ns, 'yaml_size': stat.st_size, 'data': data})
+    # Write to a temporary file and rename so readers never see a partial file
+    temp_filename = json_filename + '.tmp'
+    with open(temp_filename, mode='w', encoding='utf-8') as json_file:
+        json_file.write(content)
+    os.replace(temp_filename, json_filename)
 
 
 class Config(Singleton.Singleton):
@@ -41,10 +120,9 @@ class Config(Singleton.Singleton):
         """Read config data from yaml files
         """
         try:
-            with open(self._default_config_filename, mode='r', encoding='utf-8') as default_config_file:
-                self._default_data = yaml.load(stream=default_config_file, Loader=yaml.SafeLoader)
+            self._default_data = load_yaml_file(self._default_config_filename)
 
-        except ImportError as err:
+        except yaml.YAMLError as err:
             print(f'Failed to load yaml file: {self._default_config_filename}.')
             print(f'Error: {err}')
             sys.exit(1)
@@ -54,10 +132,8 @@ class Config(Singleton.Singleton):
             sys.exit(1)
 
         try:
-            with open(self._override_config_filename, mode='r', encoding='utf-8') as override_config_file:
-                self._override_data = yaml.load(stream=override_config_file,
-                                                Loader=yaml.SafeLoader)
-        except ImportError as err:
+            self._override_data = _load_override_file(self._override_config_filename)
+        except yaml.YAMLError as err:
             print(f'Failed to load yaml file: {self._override_config_filename}.')
             print(f'Error: {err}')
             sys.exit(1)
@@ -82,21 +158,21 @@ class Config(Singleton.Singleton):
         # Write override values to file
         with open(file=self._override_config_filename, mode="w", encoding='utf-8') as override_file:
             yaml.dump(self._override_data, override_file, default_flow_style=False)
+        _write_json_sidecar(self._override_config_filename, self._override_data)
 
     @staticmethod
     def load_alter_save(section_name, property_name, value):
         """Load from config files, alter a value, save back to config files"""
         yml = Config()
-        with open(yml.config_override_file, mode='r', encoding='utf-8') as file:
-            try:
-                altered_config = yaml.load(stream=file, Loader=yaml.SafeLoader)
-                # Handle empty override file
-                if altered_config is None:
-                    altered_config = {}
-            except ImportError as err:
-                print(f'Failed to load yaml file: {yml.config_override_file}.')
-                print(f'Error: {err}')
-                sys.exit(1)
+        try:
+            altered_config = _load_override_file(yml.config_override_file)
+            # Handle empty override file
+            if altered_config is None:
+                altered_config = {}
+        except yaml.YAMLError as err:
+            print(f'Failed to load yaml file: {yml.config_override_file}.')
+            print(f'Error: {err}')
+            sys.exit(1)
 
         if section_name not in altered_config:
             altered_config[section_name] = {}